@@ -193,8 +193,8 @@ class RPREngine(bpy.types.RenderEngine):
         layer = render_layer if render_scene else bpy.context.view_layer
 
         def do_register_pass(aov):
-            pass_channel = aov['channel']
-            pass_name = aov['name']
+            pass_channel = aov.channel
+            pass_name = aov.name
             pass_channels_size = len(pass_channel)
 
             # convert from channel to blender type
@@ -535,6 +535,15 @@ class RPRContext:
         self.context.set_parameter(key, param)
         return True
 
+    def set_parameters(self, params: dict):
+        """ Sets several context parameters at once, returns True if any of them was changed """
+        set_parameter = self.set_parameter
+        is_changed = False
+        for key, param in params.items():
+            is_changed |= set_parameter(key, param)
+
+        return is_changed
+
     def get_parameter(self, name, default=None):
         return self.context.parameters.get(name, default)
 
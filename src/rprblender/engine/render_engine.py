@@ -131,9 +131,9 @@ class RenderEngine(Engine):
                     aovs_info = RPR_ViewLayerProperites.cryptomatte_aovs_info \
                         if "Crypto" in p.name else RPR_ViewLayerProperites.aovs_info
                     aov = next((aov for aov in aovs_info
-                                if aov['name'] == p.name), None)
-                    if aov and self.rpr_context.is_aov_enabled(aov['rpr']):
-                        image = self.rpr_context.get_image(aov['rpr'])
+                                if aov.name == p.name), None)
+                    if aov and self.rpr_context.is_aov_enabled(aov.rpr):
+                        image = self.rpr_context.get_image(aov.rpr)
                     elif p.name != 'Outline':
                         log.warn(f"AOV '{p.name}' is not enabled in rpr_context "
                                  f"or not found in aovs_info")
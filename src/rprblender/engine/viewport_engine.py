@@ -1082,9 +1082,16 @@ class ViewportEngine(Engine):
 
         updated = False
         for obj in objects:
-            rpr_material = material.sync_update(self.rpr_context, active_mat, obj=obj)
-            rpr_volume = material.sync_update(self.rpr_context, active_mat, 'Volume', obj=obj)
-            rpr_displacement = material.sync_update(self.rpr_context, active_mat, 'Displacement', obj=obj)
+            # each call removes only its own socket material: Surface is recreated right here,
+            # Volume and object Displacement materials are recreated later by
+            # object.sync_update() -> mesh.assign_materials(), Displacement one only if
+            # displacement_method of the material uses displacement
+            rpr_material = material.sync_update(self.rpr_context, active_mat, obj=obj,
+                                                recreate_sockets={'Surface'})
+            rpr_volume = material.sync_update(self.rpr_context, active_mat, 'Volume', obj=obj,
+                                              recreate_sockets=set())
+            rpr_displacement = material.sync_update(self.rpr_context, active_mat, 'Displacement', obj=obj,
+                                                    recreate_sockets={'Displacement'})
 
             if not rpr_material and not rpr_volume and not rpr_displacement:
                 continue
@@ -23,6 +23,9 @@ log = logging.Log(tag='export.Material')
 
 
 def key(material: bpy.types.Material, obj=None, input_socket_key='Surface'):
+    # Object is a part of the key: Object Info, Texture Coordinate, UV Map and volume nodes
+    # export object dependent data, so parsed material nodes can't be shared between objects.
+    # Parsed nodes are cached by this key in rpr_context.material_nodes.
     mat_key = material.name_full
     obj_name = object.key(obj) if obj is not None else ''
 
@@ -50,8 +53,11 @@ def has_uv_map_node(material) -> bool:
     if not material.node_tree:
         return False
 
-    uv_map_node = next(get_material_nodes_by_type(material, 'ShaderNodeUVMap'), None)
-    return uv_map_node is not None
+    for node in material.node_tree.nodes:
+        if node.bl_idname == 'ShaderNodeUVMap':
+            return True
+
+    return False
 
 
 def get_material_input_node(material, input_socket_key: str):
@@ -74,19 +80,25 @@ def sync(rpr_context: RPRContext, material: bpy.types.Material, input_socket_key
     In other cases: returns None
     """
 
-    log(f"sync {material} '{input_socket_key}'; obj {obj}")
+    log("sync", material, input_socket_key, "obj", obj)
 
     mat_key = key(material, obj, input_socket_key)
     rpr_material = rpr_context.materials.get(mat_key, None)
     if rpr_material:
         return rpr_material
 
+    return _sync_with_key(rpr_context, material, input_socket_key, obj, mat_key)
+
+
+def _sync_with_key(rpr_context: RPRContext, material: bpy.types.Material, input_socket_key, obj, mat_key):
+    """ Exports material by already calculated mat_key, material should be absent in rpr_context """
+
     output_node = get_material_output_node(material)
     if not output_node:
         log("No output node", material)
         return None
 
-    data = {'material_key': mat_key, 'object': obj}
+    data = {'material_key': mat_key, 'object': obj, 'visited': {}}
     node_parser = ShaderNodeOutputMaterial(rpr_context, material, output_node, None, data=data)
     rpr_material = node_parser.final_export(input_socket_key)
 
@@ -100,21 +112,33 @@ def sync(rpr_context: RPRContext, material: bpy.types.Material, input_socket_key
 
 
 def sync_update(rpr_context: RPRContext, material: bpy.types.Material, input_socket_key='Surface', 
-                obj: bpy.types.Object = None):
-    """ Recreates existing material """
+                obj: bpy.types.Object = None, recreate_sockets: set = None):
+    """
+    Recreates existing material
+    recreate_sockets: which of Surface and Displacement materials to recreate, None means both;
+    other socket names are not recreated here. Material of input_socket_key is always removed,
+    Displacement is recreated without object
+    Always returns True: removed materials have to be reassigned to object by the caller
+    """
 
-    log("sync_update", material)
+    log("sync_update", material, input_socket_key, recreate_sockets)
 
     mat_key = key(material, obj, input_socket_key)
     if mat_key in rpr_context.materials:
         rpr_context.remove_material(mat_key)
 
-    sync(rpr_context, material, obj=obj)
+    if recreate_sockets is None or 'Surface' in recreate_sockets:
+        if input_socket_key == 'Surface':
+            # mat_key is already removed, no need to calculate and check it again
+            _sync_with_key(rpr_context, material, 'Surface', obj, mat_key)
+        else:
+            sync(rpr_context, material, obj=obj)
 
-    displacement_key = key(material, obj, 'Displacement')
-    if displacement_key in rpr_context.materials:
-        rpr_context.remove_material(displacement_key)
+    if recreate_sockets is None or 'Displacement' in recreate_sockets:
+        displacement_key = key(material, obj, 'Displacement')
+        if displacement_key in rpr_context.materials:
+            rpr_context.remove_material(displacement_key)
 
-    sync(rpr_context, material, input_socket_key='Displacement')
+        sync(rpr_context, material, input_socket_key='Displacement')
 
     return True
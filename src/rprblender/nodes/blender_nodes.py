@@ -20,6 +20,7 @@ All parser classes should:
 
 import bpy
 import math
+import functools
 import numpy as np
 
 import pyrpr
@@ -136,6 +137,22 @@ def eval_curve(mapping: bpy.types.CurveMapping, curve_index: int, value: float)
     return res
 
 
+@functools.lru_cache(maxsize=None)
+def get_blackbody_buffer_data() -> np.ndarray:
+    """ Black body RGBA colors for 1000K-40000K range with 100K step, it is calculated only once """
+    def rgba(t):
+        return (*convert_kelvins_to_rgb(t), 1.0)
+
+    data = np.fromiter(
+        (v for t in range(1000, 40000, 100)
+           for v in rgba(t)),
+        dtype=np.float32
+    ).reshape(-1, 4)
+    # shared between all Blackbody nodes exports
+    data.flags.writeable = False
+    return data
+
+
 class ShaderNodeOutputMaterial(BaseNodeParser):
     # inputs: Surface, Volume, Displacement
 
@@ -1832,15 +1849,8 @@ class ShaderNodeBlackbody(NodeParser):
         if isinstance(temperature.data, float):
             return self.node_item(convert_kelvins_to_rgb(temperature.data))
 
-        def rgba(t):
-            return (*convert_kelvins_to_rgb(t), 1.0)
-
-        temp_array = np.fromiter(
-            (v for t in range(1000, 40000, 100)
-               for v in rgba(t)),
-            dtype=np.float32
-        ).reshape(-1, 4)
-        rpr_buffer = self.rpr_context.create_buffer(temp_array, pyrpr.BUFFER_ELEMENT_TYPE_FLOAT32)
+        rpr_buffer = self.rpr_context.create_buffer(get_blackbody_buffer_data(),
+                                                    pyrpr.BUFFER_ELEMENT_TYPE_FLOAT32)
 
         # convert input temperature to uv lookup in buffer
         uv = (temperature - 1000.0) / 100.0
@@ -2444,16 +2454,18 @@ class ShaderNodeUVMap(NodeParser):
         """ Check if uv_map is set to primary, use LOOKUP node to set it """
         # The material preview uv_map value is surprisingly empty
 
-        if self.object and self.node.uv_map and self.object.type == 'MESH':
-            mesh = self.object.data
+        obj = self.object
+        uv_map = self.node.uv_map if obj and obj.type == 'MESH' else None
+        if uv_map:
+            mesh = obj.data
             primary_uv = mesh.rpr.primary_uv_layer
-            if primary_uv and self.node.uv_map == primary_uv.name:
+            if primary_uv and uv_map == primary_uv.name:
                 return self.create_node(pyrpr.MATERIAL_NODE_INPUT_LOOKUP, {
                     pyrpr.MATERIAL_INPUT_VALUE: pyrpr.MATERIAL_NODE_LOOKUP_UV
                 })
 
             # use secondary UV set if any available for the mesh
-            if mesh.rpr.secondary_uv_layer(self.object):
+            if mesh.rpr.secondary_uv_layer(obj):
                 return self.create_node(pyrpr.MATERIAL_NODE_INPUT_LOOKUP, {
                     pyrpr.MATERIAL_INPUT_VALUE: pyrpr.MATERIAL_NODE_LOOKUP_UV1
                 })
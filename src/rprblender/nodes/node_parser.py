@@ -71,6 +71,10 @@ class BaseNodeParser(metaclass=ABCMeta):
     def object(self):
         return self.data['object']
 
+    @property
+    def visited(self):
+        return self.data.get('visited')
+
     # INTERNAL FUNCTIONS
 
     def _export_node(self, node, socket_out, group_node=None):
@@ -96,15 +100,26 @@ class BaseNodeParser(metaclass=ABCMeta):
         if rpr_node:
             return rpr_node
 
+        # material_nodes keeps only pyrpr.MaterialNode results, values and empty results
+        # of shared subtrees are kept in visited during current material export
+        visited = self.visited
+        if visited is not None and node_key in visited:
+            return visited[node_key]
+
         # getting corresponded NodeParser class
         node_parser_class = get_node_parser_class(node.bl_idname)
         if node_parser_class:
             node_parser = node_parser_class(self.rpr_context, self.material, node, socket_out,
                                             group_nodes, data=self.data)
-            return node_parser.final_export()
+            rpr_node = node_parser.final_export()
+        else:
+            log.warn("Ignoring unsupported node", node, self.material)
+            rpr_node = None
 
-        log.warn("Ignoring unsupported node", node, self.material)
-        return None
+        if visited is not None:
+            visited[node_key] = rpr_node
+
+        return rpr_node
 
     def _parse_val(self, val):
         """ Turn a blender node val or default value for input into something that works well with rpr """
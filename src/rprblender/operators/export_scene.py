@@ -225,7 +225,7 @@ class RPR_EXPORT_OP_export_rpr_scene(RPR_Operator, ExportHelper):
         aovs = {}
         for i, enable_aov in enumerate(view_layer.rpr.enable_aovs):
             aov = view_layer.rpr.aovs_info[i]
-            aov_type = aov['rpr']
+            aov_type = aov.rpr
             if enable_aov or (use_contour and aov_type in CONTOUR_AOVS):
                 aov_name = aov_map[aov_type]
                 aovs[aov_name] = output_base + '.' + aov_name + '.png'
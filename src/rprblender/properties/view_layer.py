@@ -24,6 +24,7 @@ from bpy.props import (
 
 import pyrpr
 import math
+from typing import NamedTuple
 
 from rprblender.utils import logging
 from . import RPR_Properties
@@ -32,6 +33,13 @@ from . import RPR_Properties
 log = logging.Log(tag='properties.view_layer')
 
 
+class _AovInfo(NamedTuple):
+    """ AOV description: rpr AOV type, Blender render pass name and its channels """
+    rpr: int
+    name: str
+    channel: str
+
+
 class RPR_ContourProperties(RPR_Properties):
     """ Propoerties to do a contour pass """
     # CONTOUR render mode settings
@@ -113,22 +121,27 @@ class RPR_ContourProperties(RPR_Properties):
         default=1.0,
     )
 
+    # (property name, rpr context parameter) pairs exported as is
+    _PARAM_MAP = (
+        ('use_object_id', pyrpr.CONTEXT_CONTOUR_USE_OBJECTID),
+        ('use_material_id', pyrpr.CONTEXT_CONTOUR_USE_MATERIALID),
+        ('use_shading_normal', pyrpr.CONTEXT_CONTOUR_USE_NORMAL),
+        ('use_uv', pyrpr.CONTEXT_CONTOUR_USE_UV),
+        ('object_id_line_width', pyrpr.CONTEXT_CONTOUR_LINEWIDTH_OBJECTID),
+        ('material_id_line_width', pyrpr.CONTEXT_CONTOUR_LINEWIDTH_MATERIALID),
+        ('shading_normal_line_width', pyrpr.CONTEXT_CONTOUR_LINEWIDTH_NORMAL),
+        ('uv_line_width', pyrpr.CONTEXT_CONTOUR_LINEWIDTH_UV),
+        ('uv_threshold', pyrpr.CONTEXT_CONTOUR_UV_THRESHOLD),
+        ('antialiasing', pyrpr.CONTEXT_CONTOUR_ANTIALIASING),
+    )
+
     def export_contour_settings(self, rpr_context):
         """ set Contour render mode parameters """
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_USE_OBJECTID, self.use_object_id)
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_USE_MATERIALID, self.use_material_id)
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_USE_NORMAL, self.use_shading_normal)
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_USE_UV, self.use_uv)
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_UV_SECONDARY, self.use_uv and self.use_uv_secondary)
+        params = {param: getattr(self, attr) for attr, param in self._PARAM_MAP}
+        params[pyrpr.CONTEXT_CONTOUR_UV_SECONDARY] = self.use_uv and self.use_uv_secondary
+        params[pyrpr.CONTEXT_CONTOUR_NORMAL_THRESHOLD] = math.degrees(self.normal_threshold)
 
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_LINEWIDTH_OBJECTID, self.object_id_line_width)
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_LINEWIDTH_MATERIALID, self.material_id_line_width)
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_LINEWIDTH_NORMAL, self.shading_normal_line_width)
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_LINEWIDTH_UV, self.uv_line_width)
-
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_NORMAL_THRESHOLD, math.degrees(self.normal_threshold))
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_UV_THRESHOLD, self.uv_threshold)
-        rpr_context.set_parameter(pyrpr.CONTEXT_CONTOUR_ANTIALIASING, self.antialiasing)
+        rpr_context.set_parameters(params)
 
 
 class RPR_DenoiserProperties(RPR_Properties):
@@ -251,207 +264,65 @@ class RPR_ViewLayerProperites(RPR_Properties):
     """
 
     aovs_info = (
-        {
-            'rpr': pyrpr.AOV_COLOR,
-            'name': "Combined",
-            'channel': 'RGBA'
-        },
-        {
-            'rpr': pyrpr.AOV_DEPTH,
-            'name': "Depth",
-            'channel': 'Z'
-        },
-        {
-            'rpr': pyrpr.AOV_COLOR,
-            'name': "Color",
-            'channel': 'RGBA'
-        },
-        {
-            'rpr': pyrpr.AOV_UV,
-            'name': "UV",
-            'channel': 'UVA'
-        },
-        {
-            'rpr': pyrpr.AOV_OBJECT_ID,
-            'name': "Object Index",
-            'channel': 'X'
-        },
-        {
-            'rpr': pyrpr.AOV_MATERIAL_ID,
-            'name': "Material Index",
-            'channel': 'X'
-        },
-        {
-            'rpr': pyrpr.AOV_WORLD_COORDINATE,
-            'name': "World Coordinate",
-            'channel': 'XYZ'
-        },
-        {
-            'rpr': pyrpr.AOV_GEOMETRIC_NORMAL,
-            'name': "Geometric Normal",
-            'channel': 'XYZ'
-        },
-        {
-            'rpr': pyrpr.AOV_SHADING_NORMAL,
-            'name': "Shading Normal",
-            'channel': 'XYZ'
-        },
-        {
-            'rpr': pyrpr.AOV_CAMERA_NORMAL,
-            'name': "Camera Normal",
-            'channel': 'XYZ'
-        },
-        {
-            'rpr': pyrpr.AOV_OBJECT_GROUP_ID,
-            'name': "Group Index",
-            'channel': 'X'
-        },
-        {
-            'rpr': pyrpr.AOV_SHADOW_CATCHER,
-            'name': "Shadow Catcher",
-            'channel': 'A'
-        },
-        {
-            'rpr': pyrpr.AOV_REFLECTION_CATCHER,
-            'name': "Reflection Catcher",
-            'channel': 'A'
-        },
-        {
-            'rpr': pyrpr.AOV_BACKGROUND,
-            'name': "Background",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_EMISSION,
-            'name': "Emission",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_VELOCITY,
-            'name': "Velocity",
-            'channel': 'XYZ'
-        },
-        {
-            'rpr': pyrpr.AOV_DIRECT_ILLUMINATION,
-            'name': "Direct Illumination",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_INDIRECT_ILLUMINATION,
-            'name': "Indirect Illumination",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_AO,
-            'name': "Ambient Occlusion",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_DIRECT_DIFFUSE,
-            'name': "Direct Diffuse",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_DIRECT_REFLECT,
-            'name': "Direct Reflect",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_INDIRECT_DIFFUSE,
-            'name': "Indirect Diffuse",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_INDIRECT_REFLECT,
-            'name': "Indirect Reflect",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_REFRACT,
-            'name': "Refraction",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_VOLUME,
-            'name': "Volume",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_OPACITY,
-            'name': "Opacity",
-            'channel': 'A'
-        },
-        {
-            'rpr': pyrpr.AOV_LIGHT_GROUP0,
-            'name': "Light Group 1",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_LIGHT_GROUP1,
-            'name': "Light Group 2",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_LIGHT_GROUP2,
-            'name': "Light Group 3",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_LIGHT_GROUP3,
-            'name': "Light Group 4",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_VARIANCE,
-            'name': "Color Variance",
-            'channel': 'RGB'
-        },
-        {
-            'rpr': pyrpr.AOV_DIFFUSE_ALBEDO,
-            'name': "Diffuse Albedo",
-            'channel': 'RGB'
-        },
-    )
+        _AovInfo(pyrpr.AOV_COLOR, "Combined", 'RGBA'),
+        _AovInfo(pyrpr.AOV_DEPTH, "Depth", 'Z'),
+        _AovInfo(pyrpr.AOV_COLOR, "Color", 'RGBA'),
+        _AovInfo(pyrpr.AOV_UV, "UV", 'UVA'),
+        _AovInfo(pyrpr.AOV_OBJECT_ID, "Object Index", 'X'),
+        _AovInfo(pyrpr.AOV_MATERIAL_ID, "Material Index", 'X'),
+        _AovInfo(pyrpr.AOV_WORLD_COORDINATE, "World Coordinate", 'XYZ'),
+        _AovInfo(pyrpr.AOV_GEOMETRIC_NORMAL, "Geometric Normal", 'XYZ'),
+        _AovInfo(pyrpr.AOV_SHADING_NORMAL, "Shading Normal", 'XYZ'),
+        _AovInfo(pyrpr.AOV_CAMERA_NORMAL, "Camera Normal", 'XYZ'),
+        _AovInfo(pyrpr.AOV_OBJECT_GROUP_ID, "Group Index", 'X'),
+        _AovInfo(pyrpr.AOV_SHADOW_CATCHER, "Shadow Catcher", 'A'),
+        _AovInfo(pyrpr.AOV_REFLECTION_CATCHER, "Reflection Catcher", 'A'),
+        _AovInfo(pyrpr.AOV_BACKGROUND, "Background", 'RGB'),
+        _AovInfo(pyrpr.AOV_EMISSION, "Emission", 'RGB'),
+        _AovInfo(pyrpr.AOV_VELOCITY, "Velocity", 'XYZ'),
+        _AovInfo(pyrpr.AOV_DIRECT_ILLUMINATION, "Direct Illumination", 'RGB'),
+        _AovInfo(pyrpr.AOV_INDIRECT_ILLUMINATION, "Indirect Illumination", 'RGB'),
+        _AovInfo(pyrpr.AOV_AO, "Ambient Occlusion", 'RGB'),
+        _AovInfo(pyrpr.AOV_DIRECT_DIFFUSE, "Direct Diffuse", 'RGB'),
+        _AovInfo(pyrpr.AOV_DIRECT_REFLECT, "Direct Reflect", 'RGB'),
+        _AovInfo(pyrpr.AOV_INDIRECT_DIFFUSE, "Indirect Diffuse", 'RGB'),
+        _AovInfo(pyrpr.AOV_INDIRECT_REFLECT, "Indirect Reflect", 'RGB'),
+        _AovInfo(pyrpr.AOV_REFRACT, "Refraction", 'RGB'),
+        _AovInfo(pyrpr.AOV_VOLUME, "Volume", 'RGB'),
+        _AovInfo(pyrpr.AOV_OPACITY, "Opacity", 'A'),
+        _AovInfo(pyrpr.AOV_LIGHT_GROUP0, "Light Group 1", 'RGB'),
+        _AovInfo(pyrpr.AOV_LIGHT_GROUP1, "Light Group 2", 'RGB'),
+        _AovInfo(pyrpr.AOV_LIGHT_GROUP2, "Light Group 3", 'RGB'),
+        _AovInfo(pyrpr.AOV_LIGHT_GROUP3, "Light Group 4", 'RGB'),
+        _AovInfo(pyrpr.AOV_VARIANCE, "Color Variance", 'RGB'),
+        _AovInfo(pyrpr.AOV_DIFFUSE_ALBEDO, "Diffuse Albedo", 'RGB'),
+    )
+
+    _AOV_NAME_TO_INDEX = {info.name: i for i, info in enumerate(aovs_info)}
+
+    # aovs_info fields as separate tuples for fast access by index in export_aovs()
+    _AOV_RPR = tuple(info.rpr for info in aovs_info)
+    _AOV_NAMES = tuple(info.name for info in aovs_info)
+    _AOV_CHANNELS = tuple(info.channel for info in aovs_info)
+    _AOV_CHANNEL_LENS = tuple(len(info.channel) for info in aovs_info)
 
     # we went over 32 aovs so these must be separated
     cryptomatte_aovs_info = (
-        {
-            'rpr': pyrpr.AOV_CRYPTOMATTE_MAT0,
-            'name': "CryptoMaterial00",
-            'channel': 'RGBA'
-        },
-        {
-            'rpr': pyrpr.AOV_CRYPTOMATTE_MAT1,
-            'name': "CryptoMaterial01",
-            'channel': 'RGBA'
-        },
-        {
-            'rpr': pyrpr.AOV_CRYPTOMATTE_MAT2,
-            'name': "CryptoMaterial02",
-            'channel': 'RGBA'
-        },
-        {
-            'rpr': pyrpr.AOV_CRYPTOMATTE_OBJ0,
-            'name': "CryptoObject00",
-            'channel': 'RGBA'
-        },
-        {
-            'rpr': pyrpr.AOV_CRYPTOMATTE_OBJ1,
-            'name': "CryptoObject01",
-            'channel': 'RGBA'
-        },
-        {
-            'rpr': pyrpr.AOV_CRYPTOMATTE_OBJ2,
-            'name': "CryptoObject02",
-            'channel': 'RGBA'
-        },
-    )
-
-    contour_info = {
-        'rpr': pyrpr.AOV_COLOR,
-        'name': "Outline",
-        'channel': 'RGBA'
-    }
+        _AovInfo(pyrpr.AOV_CRYPTOMATTE_MAT0, "CryptoMaterial00", 'RGBA'),
+        _AovInfo(pyrpr.AOV_CRYPTOMATTE_MAT1, "CryptoMaterial01", 'RGBA'),
+        _AovInfo(pyrpr.AOV_CRYPTOMATTE_MAT2, "CryptoMaterial02", 'RGBA'),
+        _AovInfo(pyrpr.AOV_CRYPTOMATTE_OBJ0, "CryptoObject00", 'RGBA'),
+        _AovInfo(pyrpr.AOV_CRYPTOMATTE_OBJ1, "CryptoObject01", 'RGBA'),
+        _AovInfo(pyrpr.AOV_CRYPTOMATTE_OBJ2, "CryptoObject02", 'RGBA'),
+    )
+
+    # (rpr, name, channel length, channel) of material and object cryptomatte AOVs for export_aovs()
+    _CRYPTO_MAT = tuple((info.rpr, info.name, len(info.channel), info.channel)
+                        for info in cryptomatte_aovs_info[:3])
+    _CRYPTO_OBJ = tuple((info.rpr, info.name, len(info.channel), info.channel)
+                        for info in cryptomatte_aovs_info[3:])
+
+    contour_info = _AovInfo(pyrpr.AOV_COLOR, "Outline", 'RGBA')
         
 
     def aov_enabled_changed(self, context):
@@ -462,7 +333,7 @@ class RPR_ViewLayerProperites(RPR_Properties):
         name="Render Passes (AOVs)",
         description="Render passes (Arbitrary output variables)",
         size=len(aovs_info),
-        default=tuple(aov['name'] in ["Combined", "Depth"] for aov in aovs_info),
+        default=tuple(aov.name in ["Combined", "Depth"] for aov in aovs_info),
         update=aov_enabled_changed,
     )
 
@@ -499,51 +370,59 @@ class RPR_ViewLayerProperites(RPR_Properties):
 
         log(f"Syncing view layer: {view_layer.name}")
 
-        # should always be enabled
-        rpr_context.enable_aov(pyrpr.AOV_COLOR)
-        rpr_context.enable_aov(pyrpr.AOV_DEPTH)
-
-        for i, enable_aov in enumerate(self.enable_aovs):
-            if not enable_aov:
-                continue
+        add_pass = rpr_engine.add_pass
+        enable_aov = rpr_context.enable_aov
+        layer_name = view_layer.name
+        aov_rpr = self._AOV_RPR
+        aov_names = self._AOV_NAMES
+        aov_channels = self._AOV_CHANNELS
+        aov_channel_lens = self._AOV_CHANNEL_LENS
+
+        # Combined and Depth passes are already added by Blender itself if enabled
+        context_view_layer = bpy.context.view_layer
+        skip_passes = {
+            'Combined': context_view_layer.use_pass_combined,
+            'Depth': context_view_layer.use_pass_z,
+        }
 
-            aov = self.aovs_info[i]
+        # should always be enabled
+        enable_aov(pyrpr.AOV_COLOR)
+        enable_aov(pyrpr.AOV_DEPTH)
 
-            if aov['rpr'] == pyrpr.AOV_VARIANCE and not enable_adaptive:
+        for i, is_enabled in enumerate(self.enable_aovs):
+            if not is_enabled:
                 continue
 
-            if aov['name'] == 'Combined' and bpy.context.view_layer.use_pass_combined:
+            if aov_rpr[i] == pyrpr.AOV_VARIANCE and not enable_adaptive:
                 continue
 
-            if aov['name'] == 'Depth' and bpy.context.view_layer.use_pass_z:
+            name = aov_names[i]
+            if skip_passes.get(name, False):
                 continue
 
-            rpr_engine.add_pass(aov['name'], len(aov['channel']), aov['channel'], layer=view_layer.name)
-            rpr_context.enable_aov(aov['rpr'])
+            add_pass(name, aov_channel_lens[i], aov_channels[i], layer=layer_name)
+            enable_aov(aov_rpr[i])
 
         if cryptomatte_allowed:
             if self.crytomatte_aov_material:
-                for i in range(3):
-                    aov = self.cryptomatte_aovs_info[i]
-                    rpr_engine.add_pass(aov['name'], len(aov['channel']), aov['channel'], layer=view_layer.name)
-                    rpr_context.enable_aov(aov['rpr'])
+                for rpr, name, channel_len, channel in self._CRYPTO_MAT:
+                    add_pass(name, channel_len, channel, layer=layer_name)
+                    enable_aov(rpr)
 
             if self.crytomatte_aov_object:
-                for i in range(3, 6):
-                    aov = self.cryptomatte_aovs_info[i]
-                    rpr_engine.add_pass(aov['name'], len(aov['channel']), aov['channel'], layer=view_layer.name)
-                    rpr_context.enable_aov(aov['rpr'])
+                for rpr, name, channel_len, channel in self._CRYPTO_OBJ:
+                    add_pass(name, channel_len, channel, layer=layer_name)
+                    enable_aov(rpr)
         
         if self.use_contour_render:
             aov = self.contour_info
-            rpr_engine.add_pass(aov['name'], len(aov['channel']), aov['channel'], layer=view_layer.name)
+            add_pass(aov.name, len(aov.channel), aov.channel, layer=layer_name)
 
     def enable_aov_by_name(self, name):
         ''' Enables a give aov name '''
-        for i, aov_info in enumerate(self.aovs_info):
-            if aov_info['name'] == name:
-                self.enable_aovs[i] = True
-                return
+        i = self._AOV_NAME_TO_INDEX.get(name)
+        if i is not None:
+            self.enable_aovs[i] = True
 
     @classmethod
     def register(cls):
@@ -27,13 +27,13 @@ class RPR_VIEWLAYER_PT_aovs(RPR_Panel):
         col2 = row.column()
         for i in range(len(view_layer.enable_aovs)):
             aov = view_layer.aovs_info[i]
-            if aov['name'] == "Combined":
+            if aov.name == "Combined":
                 # not displaying "Combined" pass as it is always enabled by Blender
                 continue
 
             col = col1 if i <= (len(view_layer.enable_aovs) // 2) + 1 else col2
             r = col.row()
-            r.prop(view_layer, 'enable_aovs', index=i, text=aov['name'])
+            r.prop(view_layer, 'enable_aovs', index=i, text=aov.name)
 
         col2.prop(view_layer, 'crytomatte_aov_object')
         col2.prop(view_layer, 'crytomatte_aov_material')